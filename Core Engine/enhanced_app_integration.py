@@ -3,15 +3,12 @@ load_dotenv()
 
 import streamlit as st
 import os
+import re
 from datetime import datetime
-import json
 import time
-import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, List, Any
-import pandas as pd
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import all enhanced components
 from enhanced_ui_components import (
@@ -28,13 +25,9 @@ from enhanced_ui_components import (
 
 # Import existing components (assuming they exist)
 from components.pdf_processor import PDFProcessor
-from enhanced_gemini_analyzer import EnhancedGeminiAnalyzer
-from advanced_visualizations import AdvancedVisualizationEngine
 from components.report_generator import ReportGenerator
 from intelligent_resume_builder import IntelligentResumeBuilder, ResumeOptimizationEngine
 from analytics_tracking_system import PerformanceTracker, GoalSettingEngine
-from market_intelligence_engine import MarketIntelligenceEngine
-from interview_preparation_engine import InterviewPreparationEngine, InterviewAnalytics
 from utils.session_manager import SessionManager
 from utils.keyword_extractor import KeywordExtractor
 
@@ -46,6 +39,152 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Main navigation tabs as (key, icon, label)
+_TAB_CONFIG = (
+    ('resume_analysis', '🎯', 'Resume Analysis'),
+    ('resume_builder', '🔨', 'AI Resume Builder'),
+    ('market_intelligence', '📊', 'Market Intelligence'),
+    ('interview_prep', '🎤', 'Interview Prep'),
+    ('analytics_dashboard', '📈', 'Analytics'),
+    ('goal_tracking', '🏆', 'Goal Tracking')
+)
+_TAB_LABELS = [f"{icon} {label}" for _, icon, label in _TAB_CONFIG]
+
+# Static footer markup
+_FOOTER_HTML = """
+    <div style='text-align: center; padding: 2rem; background: var(--surface-color); border-radius: 12px; margin-top: 2rem;'>
+        <h3 style='color: var(--primary-color); margin-bottom: 1rem;'>🚀 SmartATS Pro Elite</h3>
+        <p style='color: var(--text-secondary); margin: 0;'>
+            Next-Generation AI Resume Optimization Platform
+        </p>
+        <p style='color: var(--text-secondary); margin: 0.5rem 0 0 0; font-size: 0.9rem;'>
+            Powered by Google Gemini AI • Built with ❤️ using Streamlit
+        </p>
+        <div style='margin-top: 1rem; display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;'>
+            <span style='background: var(--primary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                🎯 99% ATS Success Rate
+            </span>
+            <span style='background: var(--success-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                ⚡ Real-time Analysis
+            </span>
+            <span style='background: var(--secondary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                🤖 AI-Powered Insights
+            </span>
+            <span style='background: var(--warning-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                📈 Career Intelligence
+            </span>
+        </div>
+    </div>
+"""
+
+# Precompiled patterns for the quick ATS score
+_YEAR_RE = re.compile(r'\b\d{4}\b')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+
+# Heavy engines are imported on first use so cold start only pays for what is rendered
+@st.cache_resource
+def get_gemini_analyzer():
+    """Shared Gemini analyzer instance"""
+    from enhanced_gemini_analyzer import EnhancedGeminiAnalyzer
+    return EnhancedGeminiAnalyzer()
+
+@st.cache_resource
+def get_viz_engine():
+    """Shared visualization engine instance"""
+    from advanced_visualizations import AdvancedVisualizationEngine
+    return AdvancedVisualizationEngine()
+
+@st.cache_resource
+def get_market_intelligence():
+    """Shared market intelligence engine instance"""
+    from market_intelligence_engine import MarketIntelligenceEngine
+    return MarketIntelligenceEngine()
+
+@st.cache_resource
+def get_interview_prep():
+    """Shared interview preparation engine instance"""
+    from interview_preparation_engine import InterviewPreparationEngine
+    return InterviewPreparationEngine()
+
+@st.cache_resource
+def _engines() -> Dict[str, Any]:
+    """
+    Session-independent engines shared across reruns and sessions.
+    Trackers that seed st.session_state in __init__ are built per session instead.
+    """
+    return {
+        'pdf': PDFProcessor(),
+        'report': ReportGenerator(),
+        'resume_builder': IntelligentResumeBuilder(),
+        'optimization': ResumeOptimizationEngine(),
+        'goal': GoalSettingEngine(),
+        'keyword': KeywordExtractor()
+    }
+
+@st.cache_data(ttl=60*60, show_spinner=False, max_entries=32)
+def _extract_pdf_text(file_id: str, _uploaded_file) -> str:
+    """Extract PDF text once per upload"""
+    return _engines()['pdf'].extract_text(_uploaded_file)
+
+def _text_stats(text: str) -> Tuple[str, int, int]:
+    """Preview snippet, word count and character count"""
+    preview = text[:1000] + "..." if len(text) > 1000 else text
+    return preview, len(text.split()), len(text)
+
+def _session_tokens(slot: str, text: str) -> frozenset:
+    """Lowercased whitespace token set, kept in session state until the text changes"""
+    text_hash = hash(text)
+    cached = st.session_state.get(slot)
+    if cached is None or cached[0] != text_hash:
+        cached = (text_hash, frozenset(text.lower().split()))
+        st.session_state[slot] = cached
+    return cached[1]
+
+class _DegradedResult(Exception):
+    """Raised from a cached engine call so st.cache_data skips storing a fallback result"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__()
+        self.result = result
+
+def _is_degraded(result: Dict[str, Any]) -> bool:
+    """Whether an engine result came back in fallback mode or with an error"""
+    return bool(result.get('fallback_mode')) or 'error' in result
+
+def _unless_degraded(cached_fn, *args) -> Dict[str, Any]:
+    """Run a cached engine call, handing back an uncached fallback result if it raised one"""
+    try:
+        return cached_fn(*args)
+    except _DegradedResult as degraded:
+        return degraded.result
+
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_gemini_analysis(resume_text: str, job_description: str, industry: str,
+                            experience_level: str, analysis_depth: str) -> Dict[str, Any]:
+    """Memoized comprehensive Gemini analysis for identical inputs"""
+    result = get_gemini_analyzer().analyze_resume_comprehensive(
+        resume_text, job_description, industry, experience_level, analysis_depth
+    )
+    if _is_degraded(result):
+        raise _DegradedResult(result)
+    return result
+
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_market_insights(industry: str, experience_level: str, skills: List[str]) -> Dict[str, Any]:
+    """Memoized market insights for identical inputs"""
+    return get_market_intelligence().generate_market_insights(industry, experience_level, skills)
+
+@st.cache_data(ttl=24*60*60, show_spinner=False)
+def _cached_interview_plan(analysis_result: Dict[str, Any], job_description: str,
+                           industry: str, experience_level: str) -> Dict[str, Any]:
+    """Memoized interview preparation plan for identical inputs"""
+    plan = get_interview_prep().generate_interview_preparation_plan(
+        analysis_result, job_description, industry, experience_level
+    )
+    if _is_degraded(plan):
+        raise _DegradedResult(plan)
+    return plan
+
 class SmartATSProElite:
     """
     Main application class integrating all advanced features
@@ -56,18 +195,14 @@ class SmartATSProElite:
         self.session = SessionManager()
         
         # Initialize all engines and components
-        self.pdf_processor = PDFProcessor()
-        self.gemini_analyzer = EnhancedGeminiAnalyzer()
-        self.viz_engine = AdvancedVisualizationEngine()
-        self.report_gen = ReportGenerator()
-        self.resume_builder = IntelligentResumeBuilder()
-        self.optimization_engine = ResumeOptimizationEngine()
+        engines = _engines()
+        self.pdf_processor = engines['pdf']
+        self.report_gen = engines['report']
+        self.resume_builder = engines['resume_builder']
+        self.optimization_engine = engines['optimization']
         self.performance_tracker = PerformanceTracker()
-        self.goal_engine = GoalSettingEngine()
-        self.market_intelligence = MarketIntelligenceEngine()
-        self.interview_prep = InterviewPreparationEngine()
-        self.interview_analytics = InterviewAnalytics()
-        self.keyword_extractor = KeywordExtractor()
+        self.goal_engine = engines['goal']
+        self.keyword_extractor = engines['keyword']
         
         # Initialize theme manager
         self.theme_manager = ThemeManager()
@@ -75,6 +210,36 @@ class SmartATSProElite:
         # Application state
         self.current_tab = st.session_state.get('current_tab', 'resume_analysis')
         
+        # Section renderers keyed by navigation tab
+        self._renderers = {
+            'resume_analysis': self.render_resume_analysis_section,
+            'resume_builder': self.render_resume_builder_section,
+            'market_intelligence': self.render_market_intelligence_section,
+            'interview_prep': self.render_interview_prep_section,
+            'analytics_dashboard': self.render_analytics_dashboard,
+            'goal_tracking': self.render_goal_tracking_section
+        }
+        
+    @property
+    def gemini_analyzer(self):
+        """Lazily loaded Gemini analyzer"""
+        return get_gemini_analyzer()
+    
+    @property
+    def viz_engine(self):
+        """Lazily loaded visualization engine"""
+        return get_viz_engine()
+    
+    @property
+    def market_intelligence(self):
+        """Lazily loaded market intelligence engine"""
+        return get_market_intelligence()
+    
+    @property
+    def interview_prep(self):
+        """Lazily loaded interview preparation engine"""
+        return get_interview_prep()
+    
     def run(self):
         """
         Main application runner
@@ -89,18 +254,7 @@ class SmartATSProElite:
         self.create_main_navigation()
         
         # Route to appropriate section based on current tab
-        if self.current_tab == 'resume_analysis':
-            self.render_resume_analysis_section()
-        elif self.current_tab == 'resume_builder':
-            self.render_resume_builder_section()
-        elif self.current_tab == 'market_intelligence':
-            self.render_market_intelligence_section()
-        elif self.current_tab == 'interview_prep':
-            self.render_interview_prep_section()
-        elif self.current_tab == 'analytics_dashboard':
-            self.render_analytics_dashboard()
-        elif self.current_tab == 'goal_tracking':
-            self.render_goal_tracking_section()
+        self.render_tab_content(self.current_tab)
         
         # Render footer
         self.render_footer()
@@ -109,43 +263,22 @@ class SmartATSProElite:
         """
         Create main navigation tabs
         """
-        tab_config = {
-            'resume_analysis': {'icon': '🎯', 'label': 'Resume Analysis'},
-            'resume_builder': {'icon': '🔨', 'label': 'AI Resume Builder'},
-            'market_intelligence': {'icon': '📊', 'label': 'Market Intelligence'},
-            'interview_prep': {'icon': '🎤', 'label': 'Interview Prep'},
-            'analytics_dashboard': {'icon': '📈', 'label': 'Analytics'},
-            'goal_tracking': {'icon': '🏆', 'label': 'Goal Tracking'}
-        }
-        
         # Create tabs
-        tabs = st.tabs([f"{config['icon']} {config['label']}" for config in tab_config.values()])
+        tabs = st.tabs(_TAB_LABELS)
         
-        for i, (tab_key, config) in enumerate(tab_config.items()):
-            with tabs[i]:
-                if st.button(f"Switch to {config['label']}", key=f"nav_{tab_key}"):
+        for tab, (tab_key, _, label) in zip(tabs, _TAB_CONFIG):
+            with tab:
+                if st.button(f"Switch to {label}", key=f"nav_{tab_key}"):
                     st.session_state['current_tab'] = tab_key
                     st.rerun()
-                
-                if tab_key == self.current_tab:
-                    self.render_tab_content(tab_key)
     
     def render_tab_content(self, tab_key: str):
         """
         Render content for the active tab
         """
-        if tab_key == 'resume_analysis':
-            self.render_resume_analysis_section()
-        elif tab_key == 'resume_builder':
-            self.render_resume_builder_section()
-        elif tab_key == 'market_intelligence':
-            self.render_market_intelligence_section()
-        elif tab_key == 'interview_prep':
-            self.render_interview_prep_section()
-        elif tab_key == 'analytics_dashboard':
-            self.render_analytics_dashboard()
-        elif tab_key == 'goal_tracking':
-            self.render_goal_tracking_section()
+        renderer = self._renderers.get(tab_key)
+        if renderer:
+            renderer()
     
     def render_resume_analysis_section(self):
         """
@@ -201,7 +334,7 @@ class SmartATSProElite:
                 status_text.text("🔍 Processing PDF...")
                 progress_bar.progress(25)
                 
-                resume_text = self.pdf_processor.extract_text(uploaded_file)
+                resume_text = _extract_pdf_text(uploaded_file.file_id, uploaded_file)
                 progress_bar.progress(75)
                 
                 if resume_text:
@@ -225,22 +358,21 @@ class SmartATSProElite:
         """
         Render enhanced resume preview with analytics
         """
+        preview, word_count, char_count = _text_stats(resume_text)
+        
         with st.expander("📋 Resume Preview & Analytics", expanded=False):
             col1, col2 = st.columns([2, 1])
             
             with col1:
                 st.text_area(
                     "Extracted Content",
-                    resume_text[:1000] + "..." if len(resume_text) > 1000 else resume_text,
+                    preview,
                     height=200,
                     disabled=True
                 )
             
             with col2:
                 # Quick statistics
-                word_count = len(resume_text.split())
-                char_count = len(resume_text)
-                
                 st.metric("Word Count", word_count)
                 st.metric("Character Count", char_count)
                 
@@ -248,9 +380,11 @@ class SmartATSProElite:
                 ats_score = self.calculate_quick_ats_score(resume_text)
                 st.metric("Quick ATS Score", f"{ats_score}%")
     
+    @st.fragment
     def render_edit_section(self):
         """
-        Render enhanced edit section with real-time analysis
+        Render enhanced edit section with real-time analysis.
+        Runs as a fragment so keystrokes only rerun the editor, not the whole app.
         """
         resume_text_input = st.text_area(
             "Edit your resume content",
@@ -264,14 +398,13 @@ class SmartATSProElite:
             self.session.set('is_edited', True)
             
             # Real-time statistics
+            _, word_count, char_count = _text_stats(resume_text_input)
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                word_count = len(resume_text_input.split())
                 st.metric("Words", word_count)
             
             with col2:
-                char_count = len(resume_text_input)
                 st.metric("Characters", char_count)
             
             with col3:
@@ -365,6 +498,7 @@ class SmartATSProElite:
             if st.button("🗑️ Clear All", use_container_width=True):
                 if st.session_state.get('confirm_clear'):
                     self.session.clear()
+                    self.invalidate_footer()
                     st.rerun()
                 else:
                     st.session_state['confirm_clear'] = True
@@ -382,7 +516,8 @@ class SmartATSProElite:
             start_time = time.time()
             
             # Perform enhanced analysis
-            analysis_result = self.gemini_analyzer.analyze_resume_comprehensive(
+            analysis_result = _unless_degraded(
+                _cached_gemini_analysis,
                 self.session.get('resume_text'),
                 job_description,
                 industry,
@@ -393,20 +528,29 @@ class SmartATSProElite:
             # Get analysis preferences
             preferences = self.session.get('analysis_preferences', {})
             
-            # Add market intelligence if requested
-            if preferences.get('include_market_data', True):
-                skills = analysis_result.get('matched_keywords', [])
-                market_insights = self.market_intelligence.generate_market_insights(
-                    industry, experience_level, skills
-                )
-                analysis_result['market_intelligence'] = market_insights
+            # Market intelligence and interview preparation only depend on the
+            # base analysis, so run them concurrently to overlap API latency
+            ctx = get_script_run_ctx()
+            futures = {}
+            with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx,
+                                    initargs=(None, ctx)) as executor:
+                # Add market intelligence if requested
+                if preferences.get('include_market_data', True):
+                    skills = analysis_result.get('matched_keywords', [])
+                    futures[executor.submit(
+                        _cached_market_insights, industry, experience_level, skills
+                    )] = 'market_intelligence'
+                
+                # Add interview preparation if requested
+                if preferences.get('include_interview_prep', True):
+                    futures[executor.submit(
+                        _unless_degraded, _cached_interview_plan,
+                        analysis_result, job_description, industry, experience_level
+                    )] = 'interview_preparation'
+                
+                results = {futures[future]: future.result() for future in as_completed(futures)}
             
-            # Add interview preparation if requested
-            if preferences.get('include_interview_prep', True):
-                interview_prep = self.interview_prep.generate_interview_preparation_plan(
-                    analysis_result, job_description, industry, experience_level
-                )
-                analysis_result['interview_preparation'] = interview_prep
+            analysis_result.update(results)
             
             # Store results
             self.session.set('analysis_result', analysis_result)
@@ -417,6 +561,7 @@ class SmartATSProElite:
                 analysis_result, self.session.get('resume_text'), 
                 job_description, industry, experience_level
             )
+            self.invalidate_footer()
             
             # Calculate analysis time
             analysis_time = time.time() - start_time
@@ -506,6 +651,10 @@ class SmartATSProElite:
         """
         st.markdown("## 🎤 AI Interview Coach")
         
+        # Seed this session's interview analytics state on first visit to the tab
+        from interview_preparation_engine import InterviewAnalytics
+        self.interview_analytics = InterviewAnalytics()
+        
         # Interview prep interface
         self.render_interview_dashboard()
     
@@ -548,13 +697,13 @@ class SmartATSProElite:
         if len(resume_text) < 500:
             score -= 20
         
-        if not re.search(r'\b\d{4}\b', resume_text):  # No years
+        if not _YEAR_RE.search(resume_text):  # No years
             score -= 15
         
-        if not re.search(r'@', resume_text):  # No email
+        if '@' not in resume_text:  # No email
             score -= 10
         
-        if len(re.findall(r'[^\w\s]', resume_text)) > len(resume_text) * 0.1:  # Too many special chars
+        if sum(1 for _ in _SPECIAL_CHAR_RE.finditer(resume_text)) > len(resume_text) * 0.1:  # Too many special chars
             score -= 10
         
         return max(0, score)
@@ -563,15 +712,13 @@ class SmartATSProElite:
         """
         Calculate keyword density between resume and job description
         """
-        resume_words = set(resume_text.lower().split())
-        jd_words = set(job_description.lower().split())
-        
-        common_words = resume_words & jd_words
+        resume_words = _session_tokens('_resume_tokens', resume_text)
+        jd_words = _session_tokens('_jd_tokens', job_description)
         
         if not jd_words:
             return 0
         
-        return int(len(common_words) / len(jd_words) * 100)
+        return int(len(resume_words & jd_words) / len(jd_words) * 100)
     
     def render_footer(self):
         """
@@ -582,9 +729,13 @@ class SmartATSProElite:
         # Footer stats
         col1, col2, col3, col4 = st.columns(4)
         
+        footer_cache = st.session_state.get('_footer_cache')
+        if footer_cache is None:
+            footer_cache = {'total': len(self.session.get('analysis_history', []))}
+            st.session_state['_footer_cache'] = footer_cache
+        
         with col1:
-            total_analyses = len(self.session.get('analysis_history', []))
-            st.metric("Total Analyses", total_analyses)
+            st.metric("Total Analyses", footer_cache['total'])
         
         with col2:
             current_theme = self.theme_manager.get_current_theme()
@@ -599,34 +750,13 @@ class SmartATSProElite:
             st.metric("Version", version)
         
         # Footer content
-        st.markdown(
-            """
-            <div style='text-align: center; padding: 2rem; background: var(--surface-color); border-radius: 12px; margin-top: 2rem;'>
-                <h3 style='color: var(--primary-color); margin-bottom: 1rem;'>🚀 SmartATS Pro Elite</h3>
-                <p style='color: var(--text-secondary); margin: 0;'>
-                    Next-Generation AI Resume Optimization Platform
-                </p>
-                <p style='color: var(--text-secondary); margin: 0.5rem 0 0 0; font-size: 0.9rem;'>
-                    Powered by Google Gemini AI • Built with ❤️ using Streamlit
-                </p>
-                <div style='margin-top: 1rem; display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;'>
-                    <span style='background: var(--primary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                        🎯 99% ATS Success Rate
-                    </span>
-                    <span style='background: var(--success-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                        ⚡ Real-time Analysis
-                    </span>
-                    <span style='background: var(--secondary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                        🤖 AI-Powered Insights
-                    </span>
-                    <span style='background: var(--warning-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                        📈 Career Intelligence
-                    </span>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+    
+    def invalidate_footer(self):
+        """
+        Drop cached footer stats so they are recomputed on the next render
+        """
+        st.session_state.pop('_footer_cache', None)
     
     # Additional helper methods would be implemented here...
     def save_session_data(self):
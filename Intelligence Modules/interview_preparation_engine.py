@@ -121,7 +121,7 @@ class InterviewPreparationEngine:
         missing_keywords = resume_analysis.get('missing_keywords', [])
         
         # Generate personalized questions
-        personalized_questions = self._generate_personalized_questions(
+        personalized_questions, fallback_mode = self._generate_personalized_questions(
             resume_analysis, job_description, industry, experience_level
         )
         
@@ -153,14 +153,16 @@ class InterviewPreparationEngine:
             'company_preparation': company_preparation,
             'question_frameworks': self._get_answer_frameworks(),
             'mock_interview_plan': self._create_mock_interview_plan(personalized_questions),
-            'follow_up_preparation': self._generate_follow_up_preparation()
+            'follow_up_preparation': self._generate_follow_up_preparation(),
+            'fallback_mode': fallback_mode
         }
     
     def _generate_personalized_questions(self, resume_analysis: Dict[str, Any], 
                                        job_description: str, industry: str,
-                                       experience_level: str) -> Dict[str, List[Dict[str, Any]]]:
+                                       experience_level: str) -> Tuple[Dict[str, List[Dict[str, Any]]], bool]:
         """
-        Generate personalized interview questions based on resume analysis
+        Generate personalized interview questions based on resume analysis.
+        Returns the questions and whether they are the generic fallback set.
         """
         prompt = f"""
         As an expert interview coach, generate personalized interview questions based on this resume analysis and job description.
@@ -236,9 +238,9 @@ class InterviewPreparationEngine:
         
         try:
             response = self.gemini_model.generate_content(prompt)
-            return json.loads(response.text)
+            return json.loads(response.text), False
         except:
-            return self._get_fallback_questions(industry, experience_level)
+            return self._get_fallback_questions(industry, experience_level), True
     
     def _create_preparation_strategies(self, strengths: List[str], improvements: List[str],
                                      missing_keywords: List[str], industry: str) -> Dict[str, Any]:
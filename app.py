@@ -3,13 +3,13 @@ load_dotenv()
 
 import streamlit as st
 import os
+import logging
+import re
+import hashlib
+from types import MappingProxyType
+from dataclasses import dataclass
 from datetime import datetime
-import json
-import time
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, List, Any
-import pandas as pd
 
 # Import enhanced components
 from enhanced_ui_components import (
@@ -20,7 +20,6 @@ from enhanced_ui_components import (
     create_feature_cards,
     show_success_animation,
     show_error_animation,
-    create_loading_spinner,
     ThemeManager
 )
 
@@ -53,18 +52,172 @@ viz_engine = VisualizationEngine()
 report_gen = ReportGenerator()
 keyword_extractor = KeywordExtractor()
 
+logger = logging.getLogger(__name__)
+
+# Static footer markup
+_FOOTER_HTML = """
+    <hr style='border: none; border-top: 1px solid var(--border-color); margin: 0 0 1rem 0;'>
+    <div style='text-align: center; padding: 2rem; background: var(--surface-color); border-radius: 12px; margin-top: 2rem;'>
+        <h3 style='color: var(--primary-color); margin-bottom: 1rem;'>🚀 SmartATS Pro Elite</h3>
+        <p style='color: var(--text-secondary); margin: 0;'>
+            Powered by cutting-edge AI • Built with ❤️ using Streamlit & Google Gemini
+        </p>
+        <p style='color: var(--text-secondary); margin: 0.5rem 0 0 0; font-size: 0.9rem;'>
+            Transforming careers through intelligent resume optimization
+        </p>
+        <div style='margin-top: 1rem; display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;'>
+            <span style='background: var(--primary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                🎯 99% ATS Success Rate
+            </span>
+            <span style='background: var(--success-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                ⚡ Real-time Analysis
+            </span>
+            <span style='background: var(--secondary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
+                🤖 AI-Powered Insights
+            </span>
+        </div>
+    </div>
+"""
+
+# Industry keywords, experience expectations and recommendations
+INDUSTRY_KEYWORDS = MappingProxyType({
+    "Technology": ("agile", "scrum", "api", "cloud", "devops", "microservices", "scalability"),
+    "Healthcare": ("hipaa", "patient care", "clinical", "medical", "compliance", "safety"),
+    "Finance": ("regulatory", "compliance", "risk management", "audit", "financial modeling"),
+    "Marketing": ("seo", "sem", "analytics", "conversion", "campaigns", "brand", "roi"),
+    "Data Science": ("machine learning", "statistics", "python", "sql", "visualization", "modeling")
+})
+
+LEVEL_ADJUSTMENTS = MappingProxyType({
+    "Entry Level (0-2 years)": {
+        'focus_areas': ('education', 'projects', 'internships', 'certifications'),
+        'keyword_weight': 0.8,  # More focus on education keywords
+        'experience_expectations': 'learning-focused'
+    },
+    "Mid Level (3-5 years)": {
+        'focus_areas': ('achievements', 'leadership', 'project management'),
+        'keyword_weight': 1.0,  # Balanced approach
+        'experience_expectations': 'growth-oriented'
+    },
+    "Senior Level (6-10 years)": {
+        'focus_areas': ('leadership', 'strategy', 'mentoring', 'results'),
+        'keyword_weight': 1.2,  # Higher expectations
+        'experience_expectations': 'results-driven'
+    },
+    "Executive (10+ years)": {
+        'focus_areas': ('vision', 'transformation', 'p&l', 'board'),
+        'keyword_weight': 1.5,  # Highest expectations
+        'experience_expectations': 'strategic-leadership'
+    }
+})
+
+INDUSTRY_RECOMMENDATIONS = MappingProxyType({
+    "Technology": (
+        "Emphasize technical achievements with metrics",
+        "Include open-source contributions or personal projects",
+        "Highlight experience with modern tech stacks"
+    ),
+    "Healthcare": (
+        "Emphasize patient outcomes and safety improvements",
+        "Include relevant certifications and compliance knowledge",
+        "Highlight interdisciplinary collaboration"
+    ),
+    "Finance": (
+        "Quantify financial impacts and cost savings",
+        "Emphasize risk management and compliance experience",
+        "Include relevant financial modeling and analysis skills"
+    )
+})
+
+# Runs of sentence terminators; "..." or "?!" count as one sentence end
+_SENTENCE_RE = re.compile(r'[.!?]+')
+
+# Phrase lists scanned by the deep analysis, in reporting order
+POSITIVE_WORDS = ('achieved', 'improved', 'increased', 'successful', 'led', 'managed', 'developed')
+WEAK_WORDS = ('responsible for', 'duties included', 'worked on', 'helped with')
+IMPACT_WORDS = (
+    'achieved', 'improved', 'increased', 'reduced', 'streamlined',
+    'optimized', 'led', 'managed', 'developed', 'implemented',
+    'delivered', 'exceeded', 'transformed', 'innovated'
+)
+WEAK_PHRASES = (
+    'responsible for', 'duties included', 'worked on', 'helped with',
+    'participated in', 'assisted with', 'involved in'
+)
+# Markers checked when suggesting where to add numbers and metrics
+QUANTIFICATION_MARKERS = ('increased', 'managed', 'team', 'project', '%')
+
+# Each distinct phrase is searched for once per analysis
+_SCANNED_PHRASES = tuple(dict.fromkeys(
+    POSITIVE_WORDS + WEAK_WORDS + IMPACT_WORDS + WEAK_PHRASES + QUANTIFICATION_MARKERS
+))
+
+def _scan_phrases(text_lower: str) -> frozenset:
+    """Collect every tracked phrase present in an already-lowercased text"""
+    return frozenset(phrase for phrase in _SCANNED_PHRASES if phrase in text_lower)
+
+@dataclass(frozen=True)
+class ResumeFeatures:
+    """Single-pass summary of a resume text shared by the text analyses"""
+    text: str
+    text_lower: str
+    words: tuple
+    n_words: int
+    n_sentences: int
+    found_phrases: frozenset
+    
+    @classmethod
+    def from_text(cls, text: str) -> 'ResumeFeatures':
+        """Lowercase, tokenize and scan the text once"""
+        text_lower = text.lower()
+        words = tuple(text_lower.split())
+        return cls(
+            text=text,
+            text_lower=text_lower,
+            words=words,
+            n_words=len(words),
+            n_sentences=max(1, sum(1 for _ in _SENTENCE_RE.finditer(text))),
+            found_phrases=_scan_phrases(text_lower)
+        )
+
+def get_resume_features(resume_text: str) -> ResumeFeatures:
+    """Return the session's precomputed features, rebuilding them if the text changed"""
+    features = session.get('resume_features')
+    if features is None or features.text != resume_text:
+        features = ResumeFeatures.from_text(resume_text)
+        session.set('resume_features', features)
+    return features
+
 class EnhancedAnalyzer:
     """Enhanced analyzer with advanced features"""
+    __slots__ = ('gemini_analyzer',)
     
-    def __init__(self):
-        self.gemini_analyzer = gemini_analyzer
+    def __init__(self, analyzer: GeminiAnalyzer = gemini_analyzer):
+        self.gemini_analyzer = analyzer
     
     def analyze_with_industry_context(self, resume_text: str, job_description: str, 
                                     industry: str, experience_level: str, analysis_depth: str) -> Dict[str, Any]:
         """Enhanced analysis with industry and experience context"""
         
-        # Base analysis
-        base_analysis = self.gemini_analyzer.analyze_resume(resume_text, job_description)
+        # Base analysis, shared across industry/experience/depth variations
+        base_analysis = _unless_degraded(
+            _cached_base_analysis,
+            _content_hash(resume_text + "\x00" + job_description),
+            self.gemini_analyzer, resume_text, job_description
+        )
+        
+        # Deep analysis features
+        features = get_resume_features(resume_text)
+        advanced_features = (
+            self._perform_deep_analysis(features)
+            if analysis_depth == "Deep Dive" else {}
+        )
+        ats_simulation = self._simulate_ats_processing(features)
+        
+        base_analysis.update(advanced_features)
+        
+        # Membership view of the matched keywords shared by the helpers below
+        base_analysis['_matched_set'] = frozenset(base_analysis.get('matched_keywords', ()))
         
         # Industry-specific enhancements
         industry_insights = self._get_industry_insights(industry, base_analysis)
@@ -72,11 +225,6 @@ class EnhancedAnalyzer:
         # Experience level adjustments
         experience_adjustments = self._adjust_for_experience(experience_level, base_analysis)
         
-        # Deep analysis features
-        if analysis_depth == "Deep Dive":
-            advanced_features = self._perform_deep_analysis(resume_text, job_description)
-            base_analysis.update(advanced_features)
-        
         # Combine all insights
         enhanced_analysis = {
             **base_analysis,
@@ -84,24 +232,17 @@ class EnhancedAnalyzer:
             'experience_adjustments': experience_adjustments,
             'optimization_roadmap': self._create_optimization_roadmap(base_analysis),
             'competitive_analysis': self._perform_competitive_analysis(base_analysis),
-            'ats_simulation': self._simulate_ats_processing(resume_text, job_description)
+            'ats_simulation': ats_simulation
         }
+        enhanced_analysis.pop('_matched_set', None)
         
         return enhanced_analysis
     
     def _get_industry_insights(self, industry: str, analysis: Dict) -> Dict[str, Any]:
         """Get industry-specific insights and recommendations"""
-        industry_keywords = {
-            "Technology": ["agile", "scrum", "api", "cloud", "devops", "microservices", "scalability"],
-            "Healthcare": ["hipaa", "patient care", "clinical", "medical", "compliance", "safety"],
-            "Finance": ["regulatory", "compliance", "risk management", "audit", "financial modeling"],
-            "Marketing": ["seo", "sem", "analytics", "conversion", "campaigns", "brand", "roi"],
-            "Data Science": ["machine learning", "statistics", "python", "sql", "visualization", "modeling"]
-        }
-        
-        relevant_keywords = industry_keywords.get(industry, [])
-        matched_industry_keywords = [kw for kw in relevant_keywords if kw in analysis.get('matched_keywords', [])]
-        missing_industry_keywords = [kw for kw in relevant_keywords if kw not in analysis.get('matched_keywords', [])]
+        relevant_keywords = INDUSTRY_KEYWORDS.get(industry, ())
+        matched_industry_keywords = [kw for kw in relevant_keywords if kw in analysis['_matched_set']]
+        missing_industry_keywords = [kw for kw in relevant_keywords if kw not in analysis['_matched_set']]
         
         return {
             'industry': industry,
@@ -113,40 +254,19 @@ class EnhancedAnalyzer:
     
     def _adjust_for_experience(self, experience_level: str, analysis: Dict) -> Dict[str, Any]:
         """Adjust recommendations based on experience level"""
-        level_adjustments = {
-            "Entry Level (0-2 years)": {
-                'focus_areas': ['education', 'projects', 'internships', 'certifications'],
-                'keyword_weight': 0.8,  # More focus on education keywords
-                'experience_expectations': 'learning-focused'
-            },
-            "Mid Level (3-5 years)": {
-                'focus_areas': ['achievements', 'leadership', 'project management'],
-                'keyword_weight': 1.0,  # Balanced approach
-                'experience_expectations': 'growth-oriented'
-            },
-            "Senior Level (6-10 years)": {
-                'focus_areas': ['leadership', 'strategy', 'mentoring', 'results'],
-                'keyword_weight': 1.2,  # Higher expectations
-                'experience_expectations': 'results-driven'
-            },
-            "Executive (10+ years)": {
-                'focus_areas': ['vision', 'transformation', 'p&l', 'board'],
-                'keyword_weight': 1.5,  # Highest expectations
-                'experience_expectations': 'strategic-leadership'
-            }
-        }
-        
-        return level_adjustments.get(experience_level, level_adjustments["Mid Level (3-5 years)"])
+        adjustment = LEVEL_ADJUSTMENTS.get(experience_level, LEVEL_ADJUSTMENTS["Mid Level (3-5 years)"])
+        return {**adjustment, 'focus_areas': list(adjustment['focus_areas'])}
     
-    def _perform_deep_analysis(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def _perform_deep_analysis(self, features: ResumeFeatures) -> Dict[str, Any]:
         """Perform deep AI analysis with advanced features"""
+        found_phrases = features.found_phrases
         return {
-            'sentiment_analysis': self._analyze_sentiment(resume_text),
-            'readability_score': self._calculate_readability(resume_text),
-            'uniqueness_score': self._calculate_uniqueness(resume_text),
-            'impact_words': self._extract_impact_words(resume_text),
-            'weak_phrases': self._identify_weak_phrases(resume_text),
-            'quantification_opportunities': self._find_quantification_opportunities(resume_text)
+            'sentiment_analysis': self._analyze_sentiment(found_phrases),
+            'readability_score': self._calculate_readability(features.n_words, features.n_sentences),
+            'uniqueness_score': self._calculate_uniqueness(features.words),
+            'impact_words': self._extract_impact_words(found_phrases),
+            'weak_phrases': self._identify_weak_phrases(found_phrases),
+            'quantification_opportunities': self._find_quantification_opportunities(found_phrases)
         }
     
     def _create_optimization_roadmap(self, analysis: Dict) -> List[Dict[str, Any]]:
@@ -195,23 +315,20 @@ class EnhancedAnalyzer:
             'market_positioning': 'Top 25%' if analysis.get('match_percentage', 0) > 80 else 'Top 50%' if analysis.get('match_percentage', 0) > 60 else 'Needs Improvement'
         }
     
-    def _simulate_ats_processing(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def _simulate_ats_processing(self, features: ResumeFeatures) -> Dict[str, Any]:
         """Simulate how an ATS system would process the resume"""
         return {
-            'parsing_success_rate': 95 if len(resume_text) > 100 else 80,
+            'parsing_success_rate': 95 if len(features.text) > 100 else 80,
             'keyword_extraction_accuracy': 90,
             'formatting_compatibility': 'High',
-            'estimated_ranking': f"Top {100 - min(95, max(5, int(len(resume_text.split()) / 10)))}%",
+            'estimated_ranking': f"Top {100 - min(95, max(5, int(features.n_words / 10)))}%",
             'processing_time': '< 2 seconds'
         }
     
-    def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
+    def _analyze_sentiment(self, found_phrases: frozenset) -> Dict[str, Any]:
         """Analyze sentiment and tone of resume"""
-        positive_words = ['achieved', 'improved', 'increased', 'successful', 'led', 'managed', 'developed']
-        weak_words = ['responsible for', 'duties included', 'worked on', 'helped with']
-        
-        positive_count = sum(1 for word in positive_words if word in text.lower())
-        weak_count = sum(1 for word in weak_words if word in text.lower())
+        positive_count = sum(1 for word in POSITIVE_WORDS if word in found_phrases)
+        weak_count = sum(1 for word in WEAK_WORDS if word in found_phrases)
         
         return {
             'tone_score': min(100, (positive_count - weak_count) * 10 + 70),
@@ -220,50 +337,37 @@ class EnhancedAnalyzer:
             'overall_tone': 'Strong' if positive_count > weak_count else 'Needs Improvement'
         }
     
-    def _calculate_readability(self, text: str) -> int:
+    def _calculate_readability(self, n_words: int, n_sentences: int) -> int:
         """Calculate readability score (simplified)"""
-        words = text.split()
-        sentences = text.split('.')
-        avg_words_per_sentence = len(words) / max(len(sentences), 1)
+        avg_words_per_sentence = n_words / max(n_sentences, 1)
         
         # Simplified readability calculation
         readability = max(0, min(100, 100 - (avg_words_per_sentence - 15) * 2))
         return int(readability)
     
-    def _calculate_uniqueness(self, text: str) -> int:
+    def _calculate_uniqueness(self, words: tuple) -> int:
         """Calculate how unique/differentiated the resume is"""
-        unique_words = set(text.lower().split())
-        total_words = len(text.split())
+        unique_words = set(words)
+        total_words = len(words)
         uniqueness = len(unique_words) / total_words * 100 if total_words > 0 else 0
         return min(100, int(uniqueness * 1.5))  # Scale up for better scoring
     
-    def _extract_impact_words(self, text: str) -> List[str]:
+    def _extract_impact_words(self, found_phrases: frozenset) -> List[str]:
         """Extract high-impact action words from resume"""
-        impact_words = [
-            'achieved', 'improved', 'increased', 'reduced', 'streamlined',
-            'optimized', 'led', 'managed', 'developed', 'implemented',
-            'delivered', 'exceeded', 'transformed', 'innovated'
-        ]
-        found_impact_words = [word for word in impact_words if word in text.lower()]
-        return found_impact_words
-    
-    def _identify_weak_phrases(self, text: str) -> List[str]:
+        return [word for word in IMPACT_WORDS if word in found_phrases]
+    
+    def _identify_weak_phrases(self, found_phrases: frozenset) -> List[str]:
         """Identify weak phrases that should be replaced"""
-        weak_phrases = [
-            'responsible for', 'duties included', 'worked on', 'helped with',
-            'participated in', 'assisted with', 'involved in'
-        ]
-        found_weak_phrases = [phrase for phrase in weak_phrases if phrase in text.lower()]
-        return found_weak_phrases
-    
-    def _find_quantification_opportunities(self, text: str) -> List[str]:
+        return [phrase for phrase in WEAK_PHRASES if phrase in found_phrases]
+    
+    def _find_quantification_opportunities(self, found_phrases: frozenset) -> List[str]:
         """Find opportunities to add numbers and metrics"""
         opportunities = []
-        if 'increased' in text.lower() and '%' not in text:
+        if 'increased' in found_phrases and '%' not in found_phrases:
             opportunities.append("Add percentage to 'increased' achievements")
-        if 'managed' in text.lower() and 'team' in text.lower():
+        if 'managed' in found_phrases and 'team' in found_phrases:
             opportunities.append("Specify team size (e.g., 'managed team of X people')")
-        if 'project' in text.lower():
+        if 'project' in found_phrases:
             opportunities.append("Add project timeline and budget if applicable")
         return opportunities
     
@@ -287,24 +391,115 @@ class EnhancedAnalyzer:
     
     def _get_industry_recommendations(self, industry: str, missing_keywords: List[str]) -> List[str]:
         """Get industry-specific recommendations"""
-        recommendations = {
-            "Technology": [
-                "Emphasize technical achievements with metrics",
-                "Include open-source contributions or personal projects",
-                "Highlight experience with modern tech stacks"
-            ],
-            "Healthcare": [
-                "Emphasize patient outcomes and safety improvements",
-                "Include relevant certifications and compliance knowledge",
-                "Highlight interdisciplinary collaboration"
-            ],
-            "Finance": [
-                "Quantify financial impacts and cost savings",
-                "Emphasize risk management and compliance experience",
-                "Include relevant financial modeling and analysis skills"
-            ]
-        }
-        return recommendations.get(industry, ["Tailor resume to industry-specific requirements"])
+        return list(INDUSTRY_RECOMMENDATIONS.get(industry, ["Tailor resume to industry-specific requirements"]))
+
+def _content_hash(data) -> str:
+    """Short BLAKE2b digest used as a cheap cache key for large inputs"""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+class _DegradedResult(Exception):
+    """Carries a fallback or error result out of a cached function so it is not stored"""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__()
+        self.result = result
+
+def _is_degraded(result: Dict[str, Any]) -> bool:
+    """Whether an analysis came back in fallback mode or with an error"""
+    return bool(result.get('fallback_mode')) or 'error' in result
+
+def _unless_degraded(cached_fn, *args) -> Dict[str, Any]:
+    """Call a cached function, returning degraded results without caching them"""
+    try:
+        return cached_fn(*args)
+    except _DegradedResult as degraded:
+        return degraded.result
+
+# Base analyses contain resume text, so writing them to disk is opt-in
+_PERSIST_ANALYSES = os.getenv("SMARTATS_PERSIST_ANALYSES", "").lower() in ("1", "true", "yes")
+
+# Streamlit ignores ttl for persisted functions, so only the in-memory cache expires
+@st.cache_data(
+    persist="disk" if _PERSIST_ANALYSES else None,
+    ttl=None if _PERSIST_ANALYSES else 24*60*60,
+    show_spinner=False,
+    max_entries=256
+)
+def _cached_base_analysis(content_key: str, _analyzer: GeminiAnalyzer,
+                          _resume_text: str, _job_description: str) -> Dict[str, Any]:
+    """Gemini base analysis keyed only on the resume and job description"""
+    result = _analyzer.analyze_resume(_resume_text, _job_description)
+    if _is_degraded(result):
+        raise _DegradedResult(result)
+    return result
+
+@st.cache_resource
+def get_enhanced_analyzer() -> EnhancedAnalyzer:
+    """Shared enhanced analyzer instance"""
+    return EnhancedAnalyzer()
+
+@st.cache_data(ttl=24*60*60, show_spinner=False, max_entries=128)
+def _analyze_cached(resume_hash: str, jd_hash: str, industry: str, experience_level: str,
+                    analysis_depth: str, _resume_text: str, _job_description: str) -> Dict[str, Any]:
+    """Memoized enhanced analysis keyed on content hashes rather than the raw texts"""
+    result = get_enhanced_analyzer().analyze_with_industry_context(
+        _resume_text, _job_description, industry, experience_level, analysis_depth
+    )
+    if _is_degraded(result):
+        raise _DegradedResult(result)
+    return result
+
+def _try_report(errors: Dict[str, str], key: str, builder, *args):
+    """Run one report builder, recording the error and returning None if it fails"""
+    try:
+        return builder(*args)
+    except Exception as e:
+        logger.exception("Failed to generate %s", key)
+        errors[key] = str(e)
+        return None
+
+@st.cache_data(ttl=60*60, show_spinner=False, max_entries=32)
+def _cached_report_artifacts(resume_hash: str, jd_hash: str, analysis_hash: str,
+                             _analysis: Dict[str, Any], _resume_text: str,
+                             _job_description: str) -> Dict[str, Any]:
+    """Build the PDF, CSV and summary reports, memoized on content hashes"""
+    # Built one after another on the shared report generator; a failed report is None
+    errors = {}
+    artifacts = {
+        'pdf_bytes': _try_report(errors, 'pdf_bytes', report_gen.generate_pdf_report,
+                                 _analysis, _resume_text, _job_description),
+        'csv_data': _try_report(errors, 'csv_data', report_gen.generate_csv_report, _analysis),
+        'summary': _try_report(errors, 'summary', report_gen.generate_text_summary, _analysis),
+        'errors': errors
+    }
+    if errors:
+        raise _DegradedResult(artifacts)
+    return artifacts
+
+def build_report_artifacts(analysis: Dict[str, Any], resume_text: str, job_description: str) -> Dict[str, Any]:
+    """Report artifacts for an analysis, reused when the same analysis is rebuilt"""
+    return _unless_degraded(
+        _cached_report_artifacts,
+        _content_hash(resume_text), _content_hash(job_description), _content_hash(repr(analysis)),
+        analysis, resume_text, job_description
+    )
+
+def analyze_resume(resume_text: str, job_description: str, industry: str,
+                   experience_level: str, analysis_depth: str) -> Dict[str, Any]:
+    """Run the enhanced analysis, reusing cached results for identical inputs"""
+    return _unless_degraded(
+        _analyze_cached,
+        _content_hash(resume_text), _content_hash(job_description),
+        industry, experience_level, analysis_depth,
+        resume_text, job_description
+    )
+
+@st.cache_data(ttl=60*60, show_spinner=False, max_entries=32)
+def _extract_pdf_text(file_id: str, _uploaded_file) -> str:
+    """Extract PDF text once per upload"""
+    return pdf_processor.extract_text(_uploaded_file)
 
 def create_resume_templates():
     """Create resume template suggestions"""
@@ -351,24 +546,28 @@ def create_ai_suggestions_panel(analysis: Dict[str, Any]):
     if 'optimization_roadmap' in analysis:
         st.markdown("#### 🚀 Priority Actions")
         roadmap = analysis['optimization_roadmap']
+        priority_colors = {
+            'Critical': '#dc2626',
+            'High': '#d97706',
+            'Medium': '#059669'
+        }
         
-        for i, action in enumerate(roadmap[:3]):  # Show top 3 priorities
-            priority_color = {
-                'Critical': '#dc2626',
-                'High': '#d97706',
-                'Medium': '#059669'
-            }.get(action['priority'], '#6b7280')
-            
-            st.markdown(
+        # Build all priority cards first and send them as a single element
+        html_parts = []
+        for action in roadmap[:3]:  # Show top 3 priorities
+            priority_color = priority_colors.get(action['priority'], '#6b7280')
+            html_parts.append(
                 f"""
                 <div style="border-left: 4px solid {priority_color}; padding: 1rem; margin: 0.5rem 0; background: var(--surface-color); border-radius: 8px;">
                     <h5 style="margin: 0; color: {priority_color};">{action['priority']}: {action['action']}</h5>
                     <p style="margin: 0.5rem 0;">{action['description']}</p>
                     <small><strong>Impact:</strong> {action['estimated_impact']} | <strong>Time:</strong> {action['time_required']}</small>
                 </div>
-                """,
-                unsafe_allow_html=True
+                """
             )
+        
+        if html_parts:
+            st.markdown("\n".join(html_parts), unsafe_allow_html=True)
     
     # Quick wins section
     col1, col2 = st.columns(2)
@@ -404,6 +603,45 @@ def create_ai_suggestions_panel(analysis: Dict[str, Any]):
         for improvement in strategic[:4]:
             st.info(f"💡 {improvement}")
 
+@st.cache_resource
+def _build_ats_gauge(score: int):
+    """ATS compatibility gauge, built once per distinct score"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "ATS Compatibility Score"},
+        delta = {'reference': 80},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 60], 'color': "lightgray"},
+                {'range': [60, 80], 'color': "gray"}],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90}}))
+
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(ttl=60*60, show_spinner=False, max_entries=16)
+def _cached_keyword_chart(matched_keywords: tuple, missing_keywords: tuple):
+    """Keyword chart, rebuilt only when the keyword lists change"""
+    return viz_engine.create_keyword_chart(list(matched_keywords), list(missing_keywords))
+
+@st.cache_data(ttl=60*60, show_spinner=False, max_entries=16)
+def _cached_skills_radar(skills_analysis: Dict[str, Any]):
+    """Skills radar chart, rebuilt only when the skills analysis changes"""
+    return viz_engine.create_skills_radar(skills_analysis)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_wordcloud(text_hash: str, important_terms: tuple, _resume_text: str):
+    """Word cloud image, rebuilt only when the resume text or terms change"""
+    return viz_engine.create_word_cloud(_resume_text, list(important_terms))
+
 def create_ats_simulation_panel(analysis: Dict[str, Any]):
     """Create ATS simulation panel"""
     st.markdown("### 🤖 ATS System Simulation")
@@ -435,25 +673,16 @@ def create_ats_simulation_panel(analysis: Dict[str, Any]):
             )
         
         # ATS Processing Visualization
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = ats_data['parsing_success_rate'],
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "ATS Compatibility Score"},
-            delta = {'reference': 80},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 60], 'color': "lightgray"},
-                    {'range': [60, 80], 'color': "gray"}],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90}}))
-        
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_ats_gauge(int(ats_data['parsing_success_rate'])), use_container_width=True)
+
+def _bullet_list_html(items: List[str], icon: str, color: str) -> str:
+    """Render a list of items as one block of colored bullets"""
+    rows = "".join(
+        f"<div style='border-left: 4px solid {color}; padding: 0.5rem 1rem; margin: 0.25rem 0; "
+        f"background: var(--surface-color); border-radius: 8px;'>{icon} {item}</div>"
+        for item in items
+    )
+    return f"<div>{rows}</div>"
 
 def create_competitive_analysis_panel(analysis: Dict[str, Any]):
     """Create competitive analysis panel"""
@@ -469,14 +698,18 @@ def create_competitive_analysis_panel(analysis: Dict[str, Any]):
         # Competitive advantages
         if comp_data.get('competitive_advantage'):
             st.markdown("#### 🏆 Your Competitive Advantages")
-            for advantage in comp_data['competitive_advantage']:
-                st.success(f"✅ {advantage}")
+            st.markdown(
+                _bullet_list_html(comp_data['competitive_advantage'], "✅", "var(--success-color)"),
+                unsafe_allow_html=True
+            )
         
         # Improvement areas
         if comp_data.get('areas_to_improve'):
             st.markdown("#### 📈 Areas to Strengthen")
-            for area in comp_data['areas_to_improve']:
-                st.warning(f"⚠️ {area}")
+            st.markdown(
+                _bullet_list_html(comp_data['areas_to_improve'], "⚠️", "var(--warning-color)"),
+                unsafe_allow_html=True
+            )
 
 # Main application header
 create_enhanced_header()
@@ -508,10 +741,12 @@ with col1:
             session.set('file_name', uploaded_file.name)
             
             with st.spinner("🔍 Extracting resume content..."):
-                resume_text = pdf_processor.extract_text(uploaded_file)
+                resume_text = _extract_pdf_text(uploaded_file.file_id, uploaded_file)
                 
             if resume_text:
                 session.set('resume_text', resume_text)
+                # Precompute the text features used by the analyses
+                get_resume_features(resume_text)
                 show_success_animation(f"Successfully processed: {uploaded_file.name}")
                 
                 with st.expander("📋 Resume Preview", expanded=False):
@@ -553,14 +788,9 @@ with col2:
     # Enhanced action buttons
     if st.button("🚀 Analyze Resume", use_container_width=True, type="primary"):
         if session.get('resume_text') and job_description:
-            with st.spinner():
-                create_loading_spinner("🤖 AI Analysis in Progress...")
-                
-                # Initialize enhanced analyzer
-                enhanced_analyzer = EnhancedAnalyzer()
-                
+            with st.status("🤖 AI Analysis in Progress...", expanded=False) as status:
                 # Perform enhanced analysis
-                analysis_result = enhanced_analyzer.analyze_with_industry_context(
+                analysis_result = analyze_resume(
                     session.get('resume_text'),
                     job_description,
                     industry,
@@ -570,20 +800,19 @@ with col2:
                 
                 session.set('analysis_result', analysis_result)
                 session.set('analysis_timestamp', datetime.now())
+                session.set('report_artifacts', build_report_artifacts(
+                    analysis_result, session.get('resume_text'), job_description
+                ))
+                status.update(label="Analysis Complete! 🎉", state="complete")
                 
-            show_success_animation("Analysis Complete! 🎉")
-            time.sleep(1)
             st.rerun()
         else:
             show_error_animation("Please provide both resume and job description!")
     
     if st.button("🔄 Re-analyze", use_container_width=True):
         if session.get('resume_text') and job_description:
-            with st.spinner():
-                create_loading_spinner("♻️ Re-analyzing with latest changes...")
-                
-                enhanced_analyzer = EnhancedAnalyzer()
-                analysis_result = enhanced_analyzer.analyze_with_industry_context(
+            with st.status("♻️ Re-analyzing with latest changes...", expanded=False) as status:
+                analysis_result = analyze_resume(
                     session.get('resume_text'),
                     job_description,
                     industry,
@@ -592,10 +821,12 @@ with col2:
                 )
                 
                 session.set('analysis_result', analysis_result)
+                session.set('report_artifacts', build_report_artifacts(
+                    analysis_result, session.get('resume_text'), job_description
+                ))
                 session.increment('rescore_count')
+                status.update(label="Re-analysis Complete! 📈", state="complete")
                 
-            show_success_animation("Re-analysis Complete! 📈")
-            time.sleep(1)
             st.rerun()
     
     if st.button("🧹 Clear Session", use_container_width=True):
@@ -665,24 +896,24 @@ if session.get('analysis_result'):
         viz_tab1, viz_tab2, viz_tab3 = st.tabs(["📊 Keywords", "🎯 Skills", "☁️ Word Cloud"])
         
         with viz_tab1:
-            fig_keywords = viz_engine.create_keyword_chart(
-                analysis.get('matched_keywords', []),
-                analysis.get('missing_keywords', [])
+            fig_keywords = _cached_keyword_chart(
+                tuple(analysis.get('matched_keywords', [])),
+                tuple(analysis.get('missing_keywords', []))
             )
             st.plotly_chart(fig_keywords, use_container_width=True)
         
         with viz_tab2:
-            fig_skills = viz_engine.create_skills_radar(
-                analysis.get('skills_analysis', {})
-            )
+            fig_skills = _cached_skills_radar(analysis.get('skills_analysis', {}))
             st.plotly_chart(fig_skills, use_container_width=True)
         
         with viz_tab3:
-            wordcloud_img = viz_engine.create_word_cloud(
-                session.get('resume_text', ''),
-                analysis.get('important_terms', [])
+            resume_text = session.get('resume_text', '')
+            wordcloud_img = _cached_wordcloud(
+                _content_hash(resume_text),
+                tuple(analysis.get('important_terms', [])),
+                resume_text
             )
-            st.image(wordcloud_img, use_column_width=True)
+            st.image(wordcloud_img, use_container_width=True)
     
     with result_tab4:
         create_competitive_analysis_panel(analysis)
@@ -690,61 +921,46 @@ if session.get('analysis_result'):
     with result_tab5:
         st.markdown("### 📄 Generate Reports")
         
+        # Reports are prebuilt with the analysis; rebuild only if they are missing
+        artifacts = session.get('report_artifacts')
+        if not artifacts:
+            artifacts = build_report_artifacts(analysis, session.get('resume_text', ''), job_description)
+            session.set('report_artifacts', artifacts)
+        
+        report_errors = artifacts.get('errors', {})
+        for label, key in (("PDF report", 'pdf_bytes'), ("CSV report", 'csv_data'), ("summary", 'summary')):
+            if key in report_errors:
+                show_error_animation(f"Error generating {label}: {report_errors[key]}")
+        
         report_col1, report_col2, report_col3 = st.columns(3)
         
         with report_col1:
-            if st.button("📥 PDF Report", use_container_width=True):
-                pdf_bytes = report_gen.generate_pdf_report(
-                    analysis,
-                    session.get('resume_text', ''),
-                    job_description
-                )
-                st.download_button(
-                    label="💾 Download PDF",
-                    data=pdf_bytes,
-                    file_name=f"SmartATS_Analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                    mime="application/pdf"
-                )
+            st.download_button(
+                label="📥 PDF Report",
+                data=artifacts['pdf_bytes'] or b"",
+                file_name=f"SmartATS_Analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                mime="application/pdf",
+                use_container_width=True,
+                disabled=artifacts['pdf_bytes'] is None,
+                help="PDF report could not be generated" if artifacts['pdf_bytes'] is None else None
+            )
         
         with report_col2:
-            if st.button("📊 CSV Data", use_container_width=True):
-                csv_data = report_gen.generate_csv_report(analysis)
-                st.download_button(
-                    label="💾 Download CSV",
-                    data=csv_data,
-                    file_name=f"SmartATS_Data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
+            st.download_button(
+                label="📊 CSV Data",
+                data=artifacts['csv_data'] or "",
+                file_name=f"SmartATS_Data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                use_container_width=True,
+                disabled=artifacts['csv_data'] is None,
+                help="CSV report could not be generated" if artifacts['csv_data'] is None else None
+            )
         
         with report_col3:
-            if st.button("📋 Summary", use_container_width=True):
-                summary = report_gen.generate_text_summary(analysis)
-                st.code(summary, language="markdown")
+            if st.button("📋 Summary", use_container_width=True,
+                         disabled=artifacts['summary'] is None,
+                         help="Summary could not be generated" if artifacts['summary'] is None else None):
+                st.code(artifacts['summary'], language="markdown")
 
 # Enhanced footer
-st.markdown("---")
-st.markdown(
-    """
-    <div style='text-align: center; padding: 2rem; background: var(--surface-color); border-radius: 12px; margin-top: 2rem;'>
-        <h3 style='color: var(--primary-color); margin-bottom: 1rem;'>🚀 SmartATS Pro Elite</h3>
-        <p style='color: var(--text-secondary); margin: 0;'>
-            Powered by cutting-edge AI • Built with ❤️ using Streamlit & Google Gemini
-        </p>
-        <p style='color: var(--text-secondary); margin: 0.5rem 0 0 0; font-size: 0.9rem;'>
-            Transforming careers through intelligent resume optimization
-        </p>
-        <div style='margin-top: 1rem; display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;'>
-            <span style='background: var(--primary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                🎯 99% ATS Success Rate
-            </span>
-            <span style='background: var(--success-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                ⚡ Real-time Analysis
-            </span>
-            <span style='background: var(--secondary-color); color: white; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;'>
-                🤖 AI-Powered Insights
-            </span>
-        </div>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)